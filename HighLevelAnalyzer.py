@@ -18,13 +18,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
+
 from saleae.analyzers import HighLevelAnalyzer, AnalyzerFrame, ChoicesSetting
 
+# Numba is an optional speed boost, fall back to plain Python without it
+try:
+  from numba import njit
+except ImportError:
+  def njit(*args, **kwargs):
+    return lambda func: func
+
 # See 23A512/23LC512 datasheet, INSTRUCTION SET
-WRITE_INS = b'\x02'
-READ_INS  = b'\x03'
-RMDR_INS  = b'\x05'
-WRMR_INS  = b'\x01'
+WRITE_INS = 0x02
+READ_INS  = 0x03
+RMDR_INS  = 0x05
+WRMR_INS  = 0x01
+
+# Display names of the instructions above
+_INSTR_NAMES = {
+  WRITE_INS: 'Write',
+  READ_INS:  'Read',
+  WRMR_INS:  'Write Mode Register',
+  RMDR_INS:  'Read Mode Register'
+}
 
 # Operation Modes of the 23A512/23LC512
 BYTE_MODE       = 0x00
@@ -32,6 +49,9 @@ PAGE_MODE       = 0x02
 SEQUENTIAL_MODE = 0x01
 RESERVED        = 0x03
 
+# Display names of the modes above, indexed by mode value
+_MODE_NAMES = ('Byte', 'Sequential', 'Page', 'Reserved')
+
 # Analyzer states for Byte mode
 START      = 0
 GET_CMD    = 1
@@ -44,9 +64,37 @@ GET_DATA   = 7
 GET_REGVAL = 8
 UNKNOWN    = 9
 
+# Data keys of the frames we emit
+_K_HEADER = sys.intern('header')
+_K_INSTR  = sys.intern('instruction')
+_K_ADDR   = sys.intern('address')
+_K_DATA   = sys.intern('data')
+
+# hex() of every byte value, for formatting Data frames
+_HEX_BYTE = tuple(hex(i) for i in range(256))
+
+# Assembles the address from the three address bytes that follow the CMD byte
+@njit(cache=True)
+def _assemble_addr(b0, b1, b2):
+  return ((b0 & 0x70) << 24) | ((b0 & 0x03) << 15) | ((b1 & 0xff) << 7) | ((b2 & 0xfe) >> 1)
+
 # High level analyzers must subclass the HighLevelAnalyzer class.
 class HLA_WINCS02_SPI(HighLevelAnalyzer):
 
+  # Per-frame state lives in slots. HighLevelAnalyzer does not declare
+  # __slots__, so instances keep a __dict__ for the settings Logic assigns.
+  __slots__ = (
+    'state',
+    'instruction',
+    'address',
+    'data',
+    'address_frame_start',
+    'data_frame_start',
+    'data_frame_end',
+    '_addr_bytes',
+    '_handlers'
+  )
+
   mode_setting = ChoicesSetting(choices=('Sequential', 'Byte', 'Page'))
 
   result_types = {
@@ -72,34 +120,92 @@ class HLA_WINCS02_SPI(HighLevelAnalyzer):
     Initialize HLA.
     '''
 
-    state = START
+    self.state       = START
+    self.instruction = 0
+    self.address     = 0
+    self.data        = b''
+
+    # Address bytes buffered across GET_ADDR_0..GET_ADDR_2
+    self._addr_bytes = bytearray(3)
+
+    self.address_frame_start = None
+    self.data_frame_start    = None
+    self.data_frame_end      = None
+
+    # Result frame handlers, indexed by analyzer state
+    self._handlers = [
+      self._h_start,    # START
+      self._h_get_cmd,  # GET_CMD
+      None,             # GET_INS
+      self._h_addr0,    # GET_ADDR_0
+      self._h_addr1,    # GET_ADDR_1
+      self._h_addr2,    # GET_ADDR_2
+      None,             # GET_ADDR_3
+      None,             # GET_DATA
+      self._h_regval,   # GET_REGVAL
+      None              # UNKNOWN
+    ]
 
   def instruction_str(self, instruction):
-    if instruction == WRITE_INS:
-      return 'Write'
-    elif instruction == READ_INS:
-      return 'Read'
-    elif instruction == WRMR_INS:
-      return 'Write Mode Register'
-    elif instruction == RMDR_INS:
-      return 'Read Mode Register'
-    else:
-      return 'Unknown'
-
-  # Decodes the mode register value, see
-  # 2.5 Read Mode Register Instruction of datasheet
-  def decode_mode(self, mode_register):
-    # Mode value is in Bits 7 and 6
-    mode = (mode_register & 0xc0) >> 6
-    return mode
+    return _INSTR_NAMES.get(instruction, 'Unknown')
 
   def mode_str(self, mode):
-    if mode == BYTE_MODE:
-      return 'Byte'
-    elif mode == PAGE_MODE:
-      return 'Page'
-    elif mode == SEQUENTIAL_MODE:
-      return 'Sequential'
+    return _MODE_NAMES[mode]
+
+  def _h_start(self, frame):
+    self.instruction = frame.data['mosi'][0] # Our instruction will be on the MOSI line
+    self.address     = None               # Prepare to receive address
+    self.data        = b''                # Prepare to receive data
+
+    self.state = GET_CMD           # Next byte will be CMD
+
+    return AnalyzerFrame('Header', frame.start_time, frame.end_time, {
+      _K_HEADER: 'Head'
+    })
+
+  def _h_get_cmd(self, frame):
+    b = frame.data['mosi'][0]  # Our instruction will be on the MOSI line
+    instruction = b & 0x3F     # Instruction is in the low 6 bits of CMD
+
+    self.instruction = instruction
+    self.address     = None    # Prepare to receive address
+    self.data        = b       # Prepare to receive data
+
+    self.state = GET_ADDR_0
+
+    return AnalyzerFrame('Instruction', frame.start_time, frame.end_time, {
+      _K_INSTR: instruction
+    })
+
+  def _h_addr0(self, frame):
+    self._addr_bytes[0] = frame.data['mosi'][0]
+    self.address_frame_start = frame.start_time
+    self.state = GET_ADDR_1
+
+  def _h_addr1(self, frame):
+    self._addr_bytes[1] = frame.data['mosi'][0]
+    self.state = GET_ADDR_2
+
+  def _h_addr2(self, frame):
+    # All three address bytes are in, assemble the address in one go
+    addr_bytes = self._addr_bytes
+    addr_bytes[2] = frame.data['mosi'][0]
+    address = _assemble_addr(*addr_bytes)
+
+    self.address = address
+    self.state = GET_REGVAL
+    return AnalyzerFrame('Address', self.address_frame_start, frame.end_time, {
+      _K_ADDR: hex(address)
+    })
+
+  def _h_regval(self, frame):
+    data = frame.data['mosi'][0]
+
+    self.data = data
+    self.state = UNKNOWN
+    return AnalyzerFrame('Data', frame.start_time, frame.end_time, {
+      _K_DATA: _HEX_BYTE[data]
+    })
 
   def decode(self, frame: AnalyzerFrame):
     # SPI frame types are: enable, result, and disable
@@ -107,56 +213,15 @@ class HLA_WINCS02_SPI(HighLevelAnalyzer):
     # result
     # disable
 
+    frame_type = frame.type
+
     # A frame type of 'enable' triggers our state machine
-    if frame.type == 'enable':
+    if frame_type == 'enable':
       self.state = START
-    elif frame.type == 'result':
-      if self.state == START:
-
-        self.instruction = frame.data['mosi'] # Our instruction will be on the MOSI line
-        self.address     = None               # Prepare to receive address
-        self.data        = b''                # Prepare to receive data
-        
-        self.state = GET_CMD           # Next byte will be CMD
-
-        return AnalyzerFrame('Header', frame.start_time, frame.end_time, {
-          'header': 'Head'
-        })
-      elif self.state == GET_CMD:
-
-        self.instruction = frame.data['mosi'][0] # Our instruction will be on the MOSI line
-        self.address     = None              # Prepare to receive address
-        self.data        = frame.data['mosi'][0]                # Prepare to receive data
-
-        self.state = GET_ADDR_0
-
-        self.instruction = bytes(frame.data['mosi'])[0] & 0x3F
-        return AnalyzerFrame('Instruction', frame.start_time, frame.end_time, {
-          'instruction': bytes([self.instruction])[0]
-        })  
-      elif self.state == GET_ADDR_0:
-        self.address = (bytes(frame.data['mosi'])[0] & 0x70) << 24
-        self.address |= (bytes(frame.data['mosi'])[0] & 0x03) << 15
-        self.address_frame_start = frame.start_time
-        self.state = GET_ADDR_1
-
-      elif self.state == GET_ADDR_1:
-        self.address |= (bytes(frame.data['mosi'])[0] & 0xff) << 7
-        self.state = GET_ADDR_2
-
-      elif self.state == GET_ADDR_2:
-        self.address |= (bytes(frame.data['mosi'])[0] & 0xfe) >> 1
-        self.state = GET_REGVAL
-        return AnalyzerFrame('Address', self.address_frame_start, frame.end_time, {
-          'address': hex(self.address)
-        })  
-      elif self.state == GET_REGVAL:
-        self.data = frame.data['mosi'][0]
-        self.state = UNKNOWN
-        return AnalyzerFrame('Data', frame.start_time, frame.end_time, {
-          'data': hex(self.data)
-        })
-
-    elif frame.type == 'disable':
+    elif frame_type == 'result':
+      handler = self._handlers[self.state]
+      return handler(frame) if handler else None
+
+    elif frame_type == 'disable':
       # This isn't a valid state
       pass